@@ -15,11 +15,55 @@
 This submodule defines functions to decompose controlled operations
 """
 
+from functools import lru_cache
+
+import numpy as np
+
 import pennylane as qml
 from pennylane.operation import Operator
 from pennylane.wires import Wires
 
 
+@lru_cache(maxsize=1024)
+def _zyz_rot_angles(matrix_bytes, shape):
+    """Compute the ZYZ rotation angles of a numeric unitary, given the raw bytes and shape
+    of its ``complex128`` matrix so that repeated decompositions of the same unitary
+    are only solved once.
+
+    Args:
+        matrix_bytes (bytes): the raw bytes of the unitary matrix
+        shape (tuple[int]): the shape of the unitary matrix
+
+    Returns:
+        tuple[float]: the rotation angles ``(phi, theta, omega)``
+    """
+    U = np.frombuffer(matrix_bytes, dtype=np.complex128).reshape(shape)
+    zyz_decomp = qml.transforms.zyz_decomposition(U, 0)[0]
+    phi, theta, omega = zyz_decomp.single_qubit_rot_angles()
+    # return immutable floats so that operators built from the cached angles cannot alter them
+    return float(phi), float(theta), float(omega)
+
+
+def _is_trivial_angles(angles, atol):
+    """Determine which of the given rotation angles are close to zero.
+
+    Angles that are plain Python or NumPy numbers are checked with a single vectorized
+    comparison; any other interface falls back to ``qml.math.isclose`` for each angle.
+
+    Args:
+        angles (Sequence[tensor_like]): the rotation angles to check
+        atol (float or Sequence[float]): the absolute tolerance(s) for each angle
+
+    Returns:
+        Sequence[bool]: whether each angle is close to zero
+    """
+    if qml.math.get_interface(*angles) == "numpy":
+        return np.abs(np.asarray(angles)) <= atol
+
+    atol = np.broadcast_to(atol, (len(angles),))
+    return [qml.math.isclose(a, 0.0, atol=tol, rtol=0) for a, tol in zip(angles, atol)]
+
+
 def ctrl_decomp_zyz(target_operation: Operator, control_wires: Wires):
     """Decompose the controlled version of a target single-qubit operation
 
@@ -86,29 +130,38 @@ def ctrl_decomp_zyz(target_operation: Operator, control_wires: Wires):
         phi, theta, omega = target_operation.single_qubit_rot_angles()
     except NotImplementedError:
         with qml.QueuingManager.stop_recording():
-            zyz_decomp = qml.transforms.zyz_decomposition(
-                qml.matrix(target_operation), target_wire
-            )[0]
-        phi, theta, omega = zyz_decomp.single_qubit_rot_angles()
-
+            U = qml.matrix(target_operation)
+            if qml.math.get_interface(U) == "numpy":
+                U = np.ascontiguousarray(U, dtype=np.complex128)
+                phi, theta, omega = _zyz_rot_angles(U.tobytes(), U.shape)
+            else:
+                zyz_decomp = qml.transforms.zyz_decomposition(U, target_wire)[0]
+                phi, theta, omega = zyz_decomp.single_qubit_rot_angles()
+
+    angles = [phi, theta / 2, -(phi + omega) / 2, (omega - phi) / 2]
+    trivial_phi, trivial_theta, trivial_rz1, trivial_rz2 = _is_trivial_angles(
+        angles, atol=[1e-8, 1e-8, 1e-6, 1e-8]
+    )
+
+    mcx_wires = control_wires + target_wire
     decomp = []
 
-    if not qml.math.isclose(phi, 0.0, atol=1e-8, rtol=0):
+    if not trivial_phi:
         decomp.append(qml.RZ(phi, wires=target_wire))
-    if not qml.math.isclose(theta / 2, 0.0, atol=1e-8, rtol=0):
+    if not trivial_theta:
         decomp.extend(
             [
                 qml.RY(theta / 2, wires=target_wire),
-                qml.MultiControlledX(wires=control_wires + target_wire),
+                qml.MultiControlledX(wires=mcx_wires),
                 qml.RY(-theta / 2, wires=target_wire),
             ]
         )
     else:
-        decomp.append(qml.MultiControlledX(wires=control_wires + target_wire))
-    if not qml.math.isclose(-(phi + omega) / 2, 0.0, atol=1e-6, rtol=0):
+        decomp.append(qml.MultiControlledX(wires=mcx_wires))
+    if not trivial_rz1:
         decomp.append(qml.RZ(-(phi + omega) / 2, wires=target_wire))
-    decomp.append(qml.MultiControlledX(wires=control_wires + target_wire))
-    if not qml.math.isclose((omega - phi) / 2, 0.0, atol=1e-8, rtol=0):
+    decomp.append(qml.MultiControlledX(wires=mcx_wires))
+    if not trivial_rz2:
         decomp.append(qml.RZ((omega - phi) / 2, wires=target_wire))
 
     return decomp
@@ -19,8 +19,16 @@ import pytest
 import numpy as np
 import pennylane as qml
 from pennylane.ops import ctrl_decomp_zyz
+from pennylane.ops.op_math.controlled_decompositions import _zyz_rot_angles
 from pennylane.wires import Wires
 
+U = np.array(
+    [
+        [-0.28829348 - 0.78829734j, 0.30364367 + 0.45085995j],
+        [0.53396245 - 0.10177564j, 0.76279558 - 0.35024096j],
+    ]
+)
+
 
 class TestControlledDecompositionZYZ:
     """tests for qml.ops.ctrl_decomp_zyz"""
@@ -44,15 +52,7 @@ class TestControlledDecompositionZYZ:
         qml.PauliZ(0),
         qml.S(0),
         qml.PhaseShift(1.5, wires=0),
-        qml.QubitUnitary(
-            np.array(
-                [
-                    [-0.28829348 - 0.78829734j, 0.30364367 + 0.45085995j],
-                    [0.53396245 - 0.10177564j, 0.76279558 - 0.35024096j],
-                ]
-            ),
-            wires=0,
-        ),
+        qml.QubitUnitary(U, wires=0),
         qml.DiagonalQubitUnitary(np.array([1, -1]), wires=0),
     ]
 
@@ -137,6 +137,47 @@ class TestControlledDecompositionZYZ:
         res2 = queue_from_qnode()
         assert np.allclose(res1, res2, atol=tol, rtol=0)
 
+    def test_zyz_angles_cached(self):
+        """Test that the ZYZ angles of a numeric unitary are only computed once when the
+        same operation is decomposed for several sets of control wires, and that the
+        cached decompositions match the uncached ones and the cached angles are plain floats."""
+        op = qml.QubitUnitary(U, wires=0)
+        all_control_wires = ([1], [1, 2], [1, 2, 3])
+
+        _zyz_rot_angles.cache_clear()
+        decomps = [ctrl_decomp_zyz(op, Wires(cw)) for cw in all_control_wires]
+
+        info = _zyz_rot_angles.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+        mat = np.ascontiguousarray(U, dtype=np.complex128)
+        angles = _zyz_rot_angles(mat.tobytes(), mat.shape)
+        assert all(isinstance(angle, float) for angle in angles)
+        assert _zyz_rot_angles.cache_info().hits == 3
+
+        for cw, decomp in zip(all_control_wires, decomps):
+            _zyz_rot_angles.cache_clear()
+            expected = ctrl_decomp_zyz(op, Wires(cw))
+
+            assert len(decomp) == len(expected)
+            assert all(qml.equal(o, e) for o, e in zip(decomp, expected))
+
+    def test_zyz_angles_cache_not_mutated(self):
+        """Test that modifying the data of a decomposed operation does not affect later
+        decompositions of the same unitary."""
+        op = qml.QubitUnitary(U, wires=0)
+
+        _zyz_rot_angles.cache_clear()
+        expected = ctrl_decomp_zyz(op, Wires([1]))
+
+        decomp = ctrl_decomp_zyz(op, Wires([1]))
+        np.asarray(decomp[0].data[0])[...] = 99.0
+
+        res = ctrl_decomp_zyz(op, Wires([1]))
+        assert _zyz_rot_angles.cache_info().misses == 1
+        assert all(qml.equal(o, e) for o, e in zip(res, expected))
+
     def test_trivial_ops_in_decomposition(self):
         """Test that an operator decomposition doesn't have trivial rotations."""
         op = qml.RZ(np.pi, wires=0)
@@ -151,3 +192,21 @@ class TestControlledDecompositionZYZ:
 
         assert len(decomp) == 5
         assert all(qml.equal(o, e) for o, e in zip(decomp, expected))
+
+    @pytest.mark.autograd
+    def test_trivial_ops_in_decomposition_autograd(self):
+        """Test that trivial rotations are removed from the decomposition when the
+        target operation has trainable autograd parameters."""
+        phi = qml.numpy.array(np.pi, requires_grad=True)
+        op = qml.RZ(phi, wires=0)
+        decomp = ctrl_decomp_zyz(op, [1])
+        expected = [
+            qml.RZ(phi, wires=0),
+            qml.MultiControlledX(wires=[1, 0]),
+            qml.RZ(-phi / 2, wires=0),
+            qml.MultiControlledX(wires=[1, 0]),
+            qml.RZ(-phi / 2, wires=0),
+        ]
+
+        assert len(decomp) == 5
+        assert all(qml.equal(o, e) for o, e in zip(decomp, expected))